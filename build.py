@@ -1,25 +1,24 @@
 #!/usr/bin/env python3
 """
 Build script for Flowbite Blazor Component Library
-Supports: build, pack, publish, watch, run, start, stop, status commands
+Supports: build, pack, publish, docs, icons, size, watch, run, start, stop, status commands
 """
 
+from __future__ import annotations
+
 import sys
 import os
-import platform
-import subprocess
-import urllib.request
-import signal
 import time
 import re
 from pathlib import Path
-from typing import Optional, Dict
+from typing import TYPE_CHECKING, Optional, Dict, List, Tuple, Callable
 
-try:
+if TYPE_CHECKING:
     import psutil
-except ImportError:
-    print("Error: psutil is required. Install with: pip install psutil")
-    sys.exit(1)
+
+# Heavier modules (psutil, subprocess, urllib, http.server, concurrent.futures,
+# json, hashlib, ...) are imported inside the functions that need them so that
+# read-only commands such as `help`, `log` and `status` start quickly.
 
 REQUIRED_DOTNET_VERSION = "9.0"
 TAILWIND_VERSION = "v4.1.18"
@@ -28,11 +27,55 @@ SOLUTION_PATH = "FlowbiteBlazor.sln"
 PROJECT_PATH = "src/DemoApp/DemoApp.csproj"
 FLOWBITE_PROJECT = "src/Flowbite/Flowbite.csproj"
 EXTENDED_ICONS_PROJECT = "src/Flowbite.ExtendedIcons/Flowbite.ExtendedIcons.csproj"
+EXTENDED_ICONS_DIR = Path("src/Flowbite.ExtendedIcons")
+EXTENDED_ICONS_NAMESPACE = "Flowbite.Icons.Extended"
+ICON_SNIPPETS_DIR = Path("scripts/tmp")
 PID_FILE = Path(".demoapp.pid")
 LOG_FILE = Path("demoapp.log")
+DEMOAPP_PORT = 5290
+PORT_RELEASE_TIMEOUT = 5
 NUGET_LOCAL_DIR = Path("nuget-local")
 DIST_DIR = Path("dist")
 TEST_PROJECT = "src/Flowbite.Tests/Flowbite.Tests.csproj"
+FLOWBITE_DIR = Path("src/Flowbite")
+TEST_DIR = Path("src/Flowbite.Tests")
+TEST_WATCH_EXTENSIONS = (".cs", ".razor", ".csproj", ".props", ".targets")
+TEST_WATCH_SKIP_DIRS = {"bin", "obj", "node_modules", "wwwroot"}
+TEST_WATCH_INTERVAL = 0.5
+TEST_WATCH_DEBOUNCE = 0.3
+SIZE_BASELINE_FILE = Path("asset-sizes.json")
+LLMS_DOCS_DIR = Path("src/DemoApp/wwwroot/llms-docs")
+LLMS_CTX_FILE = Path("src/DemoApp/wwwroot/llms-ctx.md")
+LLMS_MANIFEST_FILE = Path(".llms-ctx.manifest.json")
+CRAWL_REPORT_FILE = DIST_DIR / "crawl-report.json"
+CRAWL_WORKERS = 16
+CRAWL_HEAVY_PAGE_BYTES = 512 * 1024  # Pages larger than this fail the crawl
+
+# Shipped assets measured by the `size` command (label -> file or directory)
+SIZE_ASSETS = {
+    "flowbite.min.css": Path("src/Flowbite/wwwroot/flowbite.min.css"),
+    "flowbite.js": Path("src/Flowbite/wwwroot/flowbite.js"),
+    "app.min.css": Path("src/DemoApp/wwwroot/css/app.min.css"),
+    "_framework": DIST_DIR / "wwwroot" / "_framework",
+}
+
+# Maximum allowed raw size growth (percent) versus the committed size baseline
+SIZE_BUDGETS = {
+    "flowbite.min.css": 5.0,
+    "flowbite.js": 5.0,
+    "app.min.css": 5.0,
+    "_framework": 10.0,
+}
+
+
+def require_psutil():
+    """Import psutil on demand; only process management commands need it"""
+    try:
+        import psutil
+    except ImportError:
+        print("Error: psutil is required. Install with: pip install psutil")
+        sys.exit(1)
+    return psutil
 
 
 def get_os_info() -> Dict[str, str]:
@@ -43,6 +86,8 @@ def get_os_info() -> Dict[str, str]:
     - Linux: tailwindcss-linux-x64
     - macOS: tailwindcss-macos-arm64 (Apple Silicon) or tailwindcss-macos-x64 (Intel)
     """
+    import platform
+
     system = platform.system()
 
     if system == "Linux":
@@ -71,6 +116,9 @@ def get_os_info() -> Dict[str, str]:
 
 def setup_tailwindcss() -> None:
     """Check and download Tailwind CSS if needed"""
+    import platform
+    import urllib.request
+
     os_info = get_os_info()
     tailwind_path = TOOLS_DIR / os_info["exec_name"]
 
@@ -96,6 +144,8 @@ def setup_tailwindcss() -> None:
 
 def get_dotnet_version() -> Optional[str]:
     """Get installed dotnet version, return None if not found"""
+    import subprocess
+
     try:
         result = subprocess.run(
             ["dotnet", "--version"],
@@ -146,7 +196,26 @@ def check_dotnet() -> Optional[str]:
 
 
 def is_process_running(pid: int) -> bool:
-    """Check if a process with given PID is running"""
+    """Check if a process with given PID is running
+
+    On Unix this avoids importing psutil so `status` stays fast.
+    """
+    if os.name != "nt":
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass
+
+        # Zombies have exited but not been reaped yet (Linux exposes this via /proc)
+        try:
+            stat = Path(f"/proc/{pid}/stat").read_text()
+            return stat.rsplit(")", 1)[1].split()[0] != "Z"
+        except (OSError, IndexError):
+            return True
+
+    psutil = require_psutil()
     try:
         process = psutil.Process(pid)
         return process.is_running() and process.status() != psutil.STATUS_ZOMBIE
@@ -154,8 +223,29 @@ def is_process_running(pid: int) -> bool:
         return False
 
 
+def is_process_group_running(pgid: int) -> bool:
+    """Check if any process in a Unix process group is alive (always False on Windows)
+
+    start_background() makes the `dotnet run` launcher a group leader, so a
+    DemoApp child that outlives it is still found through the launcher's PID.
+    """
+    if os.name == "nt":
+        return False
+    try:
+        os.killpg(pgid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
 def get_running_pid() -> Optional[int]:
-    """Get PID of running application if it exists"""
+    """Get the launcher PID of the running application if it exists
+
+    The PID file is kept while any process in the launcher's group is alive,
+    since stop_background() needs it to find DemoApp children of a dead launcher.
+    """
     if not PID_FILE.exists():
         return None
 
@@ -163,7 +253,7 @@ def get_running_pid() -> Optional[int]:
         with open(PID_FILE, 'r') as f:
             pid = int(f.read().strip())
 
-        if is_process_running(pid):
+        if is_process_running(pid) or is_process_group_running(pid):
             return pid
         else:
             PID_FILE.unlink()
@@ -177,8 +267,12 @@ def check_status() -> None:
     pid = get_running_pid()
 
     if pid:
-        print(f"[OK] DemoApp is running (PID: {pid})")
-        print(f"  URL: http://localhost:5290")
+        if is_process_running(pid):
+            print(f"[OK] DemoApp is running (PID: {pid})")
+        else:
+            print(f"[WARN] DemoApp launcher (PID: {pid}) has exited, but processes in its group are still running")
+            print("  Use 'python build.py stop' to stop them")
+        print(f"  URL: http://localhost:{DEMOAPP_PORT}")
         print(f"  Log file: {LOG_FILE}")
     else:
         print("[--] DemoApp is not running")
@@ -186,6 +280,9 @@ def check_status() -> None:
 
 def start_background(dotnet_path: str) -> None:
     """Start application in background"""
+    import platform
+    import subprocess
+
     existing_pid = get_running_pid()
     if existing_pid:
         print(f"DemoApp is already running (PID: {existing_pid})")
@@ -225,47 +322,170 @@ def start_background(dotnet_path: str) -> None:
     time.sleep(3)
 
     if is_process_running(process.pid):
-        print("[OK] DemoApp is running at http://localhost:5290")
+        print(f"[OK] DemoApp is running at http://localhost:{DEMOAPP_PORT}")
     else:
         print("[FAIL] DemoApp failed to start. Check log file for details:")
         print(f"  python build.py log")
 
 
-def stop_background() -> None:
-    """Stop background application"""
-    pid = get_running_pid()
+def is_port_in_use(port: int) -> bool:
+    """Check if something is accepting connections on localhost:port"""
+    import socket
 
-    if not pid:
-        print("No running DemoApp found")
-        return
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.settimeout(0.2)
+        return sock.connect_ex(("127.0.0.1", port)) == 0
 
-    print(f"Stopping DemoApp (PID: {pid})...")
 
-    try:
-        process = psutil.Process(pid)
+def find_port_owners(port: int) -> List[psutil.Process]:
+    """Return DemoApp processes listening on the given port
 
-        if platform.system() == "Windows":
-            process.terminate()
-        else:
-            process.send_signal(signal.SIGTERM)
+    Used to find a DemoApp child that outlived its `dotnet run` launcher.
+    """
+    psutil = require_psutil()
+    owners = []
+    try:
+        connections = psutil.net_connections(kind="inet")
+    except (psutil.AccessDenied, OSError):
+        return owners
 
+    for conn in connections:
+        if conn.status != psutil.CONN_LISTEN or not conn.laddr or conn.laddr.port != port or not conn.pid:
+            continue
+        try:
+            process = psutil.Process(conn.pid)
+            if "DemoApp" in " ".join(process.cmdline()) and process not in owners:
+                owners.append(process)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return owners
+
+
+def find_process_group(pgid: int) -> List[psutil.Process]:
+    """Return all live processes in a Unix process group"""
+    psutil = require_psutil()
+    members = []
+    for process in psutil.process_iter():
         try:
-            process.wait(timeout=10)
-            print("[OK] DemoApp stopped gracefully")
-        except psutil.TimeoutExpired:
-            print("DemoApp did not stop gracefully, forcing shutdown...")
-            process.kill()
-            process.wait(timeout=5)
-            print("[OK] DemoApp stopped forcefully")
+            if os.getpgid(process.pid) == pgid:
+                members.append(process)
+        except (ProcessLookupError, PermissionError, psutil.NoSuchProcess):
+            continue
+    return members
+
+
+def wait_for_exit(processes: List[psutil.Process], timeout: float) -> List[psutil.Process]:
+    """Poll until all processes have exited, return the ones still alive after timeout
+
+    Zombies count as exited: they hold no ports or file locks, and reaping them
+    is up to their (possibly re-assigned) parent.
+    """
+    psutil = require_psutil()
+    deadline = time.perf_counter() + timeout
+    alive = list(processes)
+    while True:
+        still_alive = []
+        for process in alive:
+            try:
+                if process.is_running() and process.status() != psutil.STATUS_ZOMBIE:
+                    still_alive.append(process)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        alive = still_alive
+        if not alive or time.perf_counter() >= deadline:
+            return alive
+        time.sleep(0.02)
+
+
+def stop_background() -> None:
+    """Stop background application and every process it spawned
 
+    The `dotnet run` launcher in PID_FILE starts DemoApp as a child process, so
+    the whole tree (and, on Unix, its process group) is signalled at once.
+    Returns as soon as all processes have exited and DEMOAPP_PORT is free.
+    """
+    import platform
+    import signal
+    psutil = require_psutil()
+
+    started = time.perf_counter()
+
+    # Read the stored PID directly: the launcher may be gone while its children live on
+    pid = None
+    try:
+        with open(PID_FILE, 'r') as f:
+            pid = int(f.read().strip())
+    except (ValueError, IOError):
+        pass
+
+    processes: List[psutil.Process] = []
+    if pid and is_process_running(pid):
+        print(f"Stopping DemoApp (PID: {pid})...")
+        try:
+            launcher = psutil.Process(pid)
+            # Collect children before signalling; they are re-parented once the launcher exits
+            processes = [launcher] + launcher.children(recursive=True)
+        except psutil.NoSuchProcess:
+            pass
+    elif pid and is_process_group_running(pid):
+        print(f"Stopping DemoApp processes left by exited launcher (PID: {pid})...")
+
+    if pid and platform.system() != "Windows":
+        # start_background() uses start_new_session, so the launcher's PID is the group ID
+        for member in find_process_group(pid):
+            if member not in processes:
+                processes.append(member)
+
+    for owner in find_port_owners(DEMOAPP_PORT):
+        if owner not in processes:
+            print(f"Stopping orphaned DemoApp process listening on port {DEMOAPP_PORT} (PID: {owner.pid})...")
+            processes.append(owner)
+
+    if not processes:
         if PID_FILE.exists():
             PID_FILE.unlink()
+        print("No running DemoApp found")
+        return
+
+    try:
+        if pid and platform.system() != "Windows":
+            try:
+                os.killpg(pid, signal.SIGTERM)
+            except (ProcessLookupError, PermissionError):
+                pass
+
+        for process in processes:
+            try:
+                process.terminate()
+            except psutil.NoSuchProcess:
+                pass
+
+        alive = wait_for_exit(processes, timeout=10)
+        if alive:
+            print(f"{len(alive)} process(es) did not stop gracefully, forcing shutdown...")
+            for process in alive:
+                try:
+                    process.kill()
+                except psutil.NoSuchProcess:
+                    pass
+            alive = wait_for_exit(alive, timeout=5)
+            if alive:
+                print(f"[WARN] Could not stop PID(s): {', '.join(str(p.pid) for p in alive)}")
 
-    except psutil.NoSuchProcess:
-        print("Process already stopped")
         if PID_FILE.exists():
             PID_FILE.unlink()
 
+        # Sockets can linger briefly after the owning process exits
+        deadline = time.perf_counter() + PORT_RELEASE_TIMEOUT
+        while is_port_in_use(DEMOAPP_PORT) and time.perf_counter() < deadline:
+            time.sleep(0.05)
+
+        elapsed = time.perf_counter() - started
+        if is_port_in_use(DEMOAPP_PORT):
+            print(f"[WARN] DemoApp stopped in {elapsed:.2f}s but port {DEMOAPP_PORT} is still in use")
+        else:
+            print(f"[OK] DemoApp stopped in {elapsed:.2f}s ({len(processes)} process(es), port {DEMOAPP_PORT} free)")
+
     except Exception as e:
         print(f"Error stopping DemoApp: {e}")
         sys.exit(1)
@@ -279,6 +499,8 @@ def run_tailwind_css() -> None:
     - Uses --minify flag for production builds
     - CSS file contains @import, @source, @plugin, @theme directives
     """
+    import subprocess
+
     os_info = get_os_info()
     # Use absolute path so it works when subprocess uses different cwd
     tailwind_path = (TOOLS_DIR / os_info["exec_name"]).resolve()
@@ -314,352 +536,1186 @@ def run_tailwind_css() -> None:
         print(f"[WARN] DemoApp CSS build failed: {demoapp_result.stderr}")
 
 
-def run_dotnet_command(dotnet_path: str, command: str) -> None:
-    """Execute the appropriate dotnet command"""
+def load_brotli():
+    """Import brotli if available (optional: pip install brotli)"""
     try:
-        if command == "build":
-            # Auto-stop any running application to prevent file lock issues
-            pid = get_running_pid()
-            if pid:
-                print("Stopping running DemoApp before build...")
-                stop_background()
-
-            # Run Tailwind CSS before dotnet build
-            run_tailwind_css()
-
-            print("Building solution...")
-            subprocess.run(
-                [dotnet_path, "build", SOLUTION_PATH],
-                check=True
-            )
-            print("[OK] Successfully built solution")
-
-        elif command == "watch":
-            print("Starting DemoApp with hot reload...")
-            print("Press Ctrl+C to stop watching...")
-
-            env = os.environ.copy()
-            env["ASPNETCORE_ENVIRONMENT"] = "Development"
-
-            subprocess.run(
-                [dotnet_path, "watch", "--project", PROJECT_PATH, "--no-restore"],
-                env=env
-            )
-
-        elif command == "run":
-            print("Running DemoApp...")
-            print("Press Ctrl+C to stop...")
-
-            env = os.environ.copy()
-            env["ASPNETCORE_ENVIRONMENT"] = "Development"
-
-            subprocess.run(
-                [dotnet_path, "run", "--project", PROJECT_PATH, "--no-restore"],
-                env=env
-            )
-
-        elif command == "start":
-            # Auto-stop any running application
-            pid = get_running_pid()
-            if pid:
-                print("Stopping running DemoApp before build...")
-                stop_background()
-
-            # Run Tailwind CSS before dotnet build
-            run_tailwind_css()
-
-            # Auto-build before starting
-            print("Building solution before start...")
-            subprocess.run(
-                [dotnet_path, "build", SOLUTION_PATH],
-                check=True
-            )
-            start_background(dotnet_path)
-
-        elif command == "stop":
-            stop_background()
+        import brotli
+    except ImportError:
+        return None
+    return brotli
 
-        elif command == "status":
-            check_status()
-
-        elif command == "pack":
-            # Pack NuGet packages (like publish-local.ps1)
-            print(f"Creating NuGet packages in {NUGET_LOCAL_DIR}...")
-            NUGET_LOCAL_DIR.mkdir(parents=True, exist_ok=True)
-
-            # Pack Flowbite
-            print("Packing Flowbite...")
-            subprocess.run(
-                [dotnet_path, "pack", FLOWBITE_PROJECT, "-c", "Release", "-o", str(NUGET_LOCAL_DIR)],
-                check=True
-            )
-
-            # Pack Flowbite.ExtendedIcons
-            print("Packing Flowbite.ExtendedIcons...")
-            subprocess.run(
-                [dotnet_path, "pack", EXTENDED_ICONS_PROJECT, "-c", "Release", "-o", str(NUGET_LOCAL_DIR)],
-                check=True
-            )
-
-            print(f"[OK] NuGet packages created in {NUGET_LOCAL_DIR}")
-
-        elif command == "publish":
-            # Full publish flow: pack + publish demo
-            print(f"Publishing solution...")
-
-            # Pack NuGet packages first
-            NUGET_LOCAL_DIR.mkdir(parents=True, exist_ok=True)
-
-            print("Packing Flowbite...")
-            subprocess.run(
-                [dotnet_path, "pack", FLOWBITE_PROJECT, "-c", "Release", "-o", str(NUGET_LOCAL_DIR)],
-                check=True
-            )
-
-            print("Packing Flowbite.ExtendedIcons...")
-            subprocess.run(
-                [dotnet_path, "pack", EXTENDED_ICONS_PROJECT, "-c", "Release", "-o", str(NUGET_LOCAL_DIR)],
-                check=True
-            )
-
-            print(f"[OK] NuGet packages created in {NUGET_LOCAL_DIR}")
-
-            # Publish DemoApp
-            print(f"Publishing DemoApp to {DIST_DIR}...")
-
-            # Clean dist directory
-            if DIST_DIR.exists():
-                import shutil
-                shutil.rmtree(DIST_DIR)
-
-            subprocess.run(
-                [dotnet_path, "publish", PROJECT_PATH, "-c", "Release", "-o", str(DIST_DIR)],
-                check=True
-            )
-
-            print(f"[OK] Successfully published to {DIST_DIR}")
-            print("")
-            print("To serve locally:")
-            print("  1. Ensure you have dotnet-serve installed: dotnet tool install -g dotnet-serve")
-            print(f"  2. Run: cd {DIST_DIR}/wwwroot && dotnet serve")
-
-        elif command == "test":
-            # Run unit tests (excluding integration tests)
-            print("Running unit tests...")
-
-            # Build test arguments
-            test_args = [dotnet_path, "test", TEST_PROJECT]
-
-            # Parse additional arguments
-            extra_args = sys.argv[2:]
-            filter_value = None
-
-            i = 0
-            while i < len(extra_args):
-                if extra_args[i] == "--filter" and i + 1 < len(extra_args):
-                    filter_value = extra_args[i + 1]
-                    i += 2
-                elif not extra_args[i].startswith("--"):
-                    # Treat as filter value if no --filter prefix
-                    filter_value = extra_args[i]
-                    i += 1
-                else:
-                    i += 1
-
-            # Apply filter (exclude integration tests by default unless specific filter given)
-            if filter_value:
-                test_args.extend(["--filter", filter_value])
-            else:
-                test_args.extend(["--filter", "Category!=Integration"])
-
-            subprocess.run(test_args, check=True)
-            print("[OK] Unit tests completed")
-
-        elif command == "test-integration":
-            # Run integration tests (requires DemoApp to be running)
-            print("Running integration tests...")
-
-            # Check if DemoApp is running
-            pid = get_running_pid()
-            was_started = False
-
-            if not pid:
-                print("DemoApp not running. Starting it now...")
-                # Build and start
-                run_tailwind_css()
-                subprocess.run([dotnet_path, "build", SOLUTION_PATH], check=True)
-                start_background(dotnet_path)
-                was_started = True
-                # Wait for app to be ready
-                print("Waiting for DemoApp to be ready...")
-                time.sleep(5)
 
-            try:
-                # Run integration tests
-                test_args = [dotnet_path, "test", TEST_PROJECT, "--filter", "Category=Integration"]
-                subprocess.run(test_args, check=True)
-                print("[OK] Integration tests completed")
-            finally:
-                # Stop DemoApp if we started it
-                if was_started:
-                    print("Stopping DemoApp...")
-                    stop_background()
-
-        elif command == "test-publish":
-            # Run publish as a test to catch pre-rendering errors
-            print("Testing publish process (catches pre-rendering errors)...")
-            print("")
-
-            # Pack NuGet packages first
-            NUGET_LOCAL_DIR.mkdir(parents=True, exist_ok=True)
-
-            print("Packing Flowbite...")
-            pack_result = subprocess.run(
-                [dotnet_path, "pack", FLOWBITE_PROJECT, "-c", "Release", "-o", str(NUGET_LOCAL_DIR)]
-            )
-            if pack_result.returncode != 0:
-                print("[FAIL] Flowbite pack failed")
-                sys.exit(1)
+def measure_file(path: Path) -> Dict[str, Optional[int]]:
+    """Return raw, gzip and brotli sizes (in bytes) of a single file"""
+    import gzip
+    brotli = load_brotli()
 
-            print("Packing Flowbite.ExtendedIcons...")
-            pack_ext_result = subprocess.run(
-                [dotnet_path, "pack", EXTENDED_ICONS_PROJECT, "-c", "Release", "-o", str(NUGET_LOCAL_DIR)]
-            )
-            if pack_ext_result.returncode != 0:
-                print("[FAIL] Flowbite.ExtendedIcons pack failed")
-                sys.exit(1)
+    data = path.read_bytes()
+    return {
+        "raw": len(data),
+        "gzip": len(gzip.compress(data, compresslevel=9, mtime=0)),
+        "brotli": len(brotli.compress(data, quality=11)) if brotli else None,
+    }
 
-            # Publish DemoApp (this runs pre-rendering which catches binding errors)
-            print(f"Publishing DemoApp to {DIST_DIR} (with pre-rendering)...")
 
-            # Clean dist directory
-            if DIST_DIR.exists():
-                import shutil
-                shutil.rmtree(DIST_DIR)
+def measure_asset(path: Path) -> Optional[Dict[str, Optional[int]]]:
+    """Measure a file, or the sum of all files in a directory
 
-            publish_result = subprocess.run(
-                [dotnet_path, "publish", PROJECT_PATH, "-c", "Release", "-o", str(DIST_DIR)]
-            )
+    Pre-compressed siblings (.gz/.br) emitted by dotnet publish are skipped
+    so the _framework payload is only counted once.
+    """
+    if path.is_file():
+        files = [path]
+    elif path.is_dir():
+        files = [
+            f for f in sorted(path.rglob("*"))
+            if f.is_file() and f.suffix not in (".gz", ".br")
+        ]
+    else:
+        return None
 
-            if publish_result.returncode != 0:
-                print("")
-                print("[FAIL] Publish test failed!")
-                print("This usually indicates pre-rendering errors (e.g., missing @bind-Value).")
-                print("Check the error output above for details.")
-                sys.exit(1)
+    from concurrent.futures import ThreadPoolExecutor
 
-            print("")
-            print("[OK] Publish test passed - all pages pre-rendered successfully")
+    totals: Dict[str, Optional[int]] = {"raw": 0, "gzip": 0, "brotli": 0 if load_brotli() else None, "files": len(files)}
+    with ThreadPoolExecutor() as pool:
+        for sizes in pool.map(measure_file, files):
+            for key in ("raw", "gzip", "brotli"):
+                if totals[key] is not None:
+                    totals[key] += sizes[key]
+    return totals
 
-        elif command == "test-all":
-            # Run all tests: unit tests, publish test, then integration tests
-            print("Running all tests (unit + publish + integration)...")
-            print("")
 
-            # Step 1: Run unit tests
-            print("=" * 60)
-            print("STEP 1: Running unit tests...")
-            print("=" * 60)
-            unit_test_args = [dotnet_path, "test", TEST_PROJECT, "--filter", "Category!=Integration"]
-            unit_result = subprocess.run(unit_test_args)
+def format_size(size: Optional[int]) -> str:
+    """Format a byte count for display"""
+    if size is None:
+        return "n/a"
+    if size < 1024:
+        return f"{size} B"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size / (1024 * 1024):.2f} MB"
 
-            if unit_result.returncode != 0:
-                print("[FAIL] Unit tests failed")
-                sys.exit(1)
 
-            print("[OK] Unit tests passed")
-            print("")
+def report_asset_sizes(update: bool = False, require_all: bool = False) -> bool:
+    """Report shipped asset sizes and compare them with the committed baseline
 
-            # Step 2: Run publish test (catches pre-rendering errors)
-            print("=" * 60)
-            print("STEP 2: Running publish test (pre-rendering validation)...")
-            print("=" * 60)
+    The baseline (SIZE_BASELINE_FILE) only moves on `size --update`, so budgets
+    bound total growth since the last accepted sizes, not growth between runs.
+    A budgeted asset without a baseline entry fails, since its budget could never fire.
 
-            NUGET_LOCAL_DIR.mkdir(parents=True, exist_ok=True)
+    Args:
+        update: Write the current sizes as the new baseline
+        require_all: Fail if a budgeted asset is missing (used after publish,
+            when _framework must exist)
 
-            print("Packing Flowbite...")
-            pack_result = subprocess.run(
-                [dotnet_path, "pack", FLOWBITE_PROJECT, "-c", "Release", "-o", str(NUGET_LOCAL_DIR)]
-            )
-            if pack_result.returncode != 0:
-                print("[FAIL] Flowbite pack failed")
-                sys.exit(1)
+    Returns:
+        True if all assets are within their SIZE_BUDGETS (always True on update)
+    """
+    import json
 
-            print("Packing Flowbite.ExtendedIcons...")
-            pack_ext_result = subprocess.run(
-                [dotnet_path, "pack", EXTENDED_ICONS_PROJECT, "-c", "Release", "-o", str(NUGET_LOCAL_DIR)]
-            )
-            if pack_ext_result.returncode != 0:
-                print("[FAIL] Flowbite.ExtendedIcons pack failed")
-                sys.exit(1)
+    baseline: Dict[str, Dict] = {}
+    if SIZE_BASELINE_FILE.exists():
+        try:
+            with open(SIZE_BASELINE_FILE, 'r') as f:
+                baseline = json.load(f).get("assets", {})
+        except (ValueError, IOError) as e:
+            print(f"[FAIL] Unreadable size baseline {SIZE_BASELINE_FILE}: {e}")
+            return False
 
-            if DIST_DIR.exists():
-                import shutil
-                shutil.rmtree(DIST_DIR)
+    if load_brotli() is None:
+        print("Note: brotli sizes unavailable. Install with: pip install brotli")
+
+    current: Dict[str, Dict] = {}
+    failures: List[str] = []
+
+    print(f"{'Asset':<20} {'Raw':>10} {'Gzip':>10} {'Brotli':>10} {'Change':>9}")
+    print("-" * 63)
+
+    for label, path in SIZE_ASSETS.items():
+        sizes = measure_asset(path)
+        budget = SIZE_BUDGETS.get(label)
+        if sizes is None:
+            print(f"{label:<20} {'missing':>10}   ({path})")
+            if require_all and budget is not None:
+                failures.append(f"{label} is budgeted but missing at {path}")
+            continue
+
+        current[label] = sizes
+        change = "no base"
+        before = baseline.get(label, {}).get("raw")
+        if before:
+            growth = (sizes["raw"] - before) * 100.0 / before
+            change = f"{growth:+.1f}%"
+            if budget is not None and growth > budget:
+                failures.append(f"{label} grew {growth:.1f}% since baseline (budget {budget:.1f}%)")
+        elif budget is not None:
+            failures.append(f"{label} has no baseline in {SIZE_BASELINE_FILE}")
+
+        print(f"{label:<20} {format_size(sizes['raw']):>10} {format_size(sizes['gzip']):>10} "
+              f"{format_size(sizes['brotli']):>10} {change:>9}")
 
-            publish_result = subprocess.run(
-                [dotnet_path, "publish", PROJECT_PATH, "-c", "Release", "-o", str(DIST_DIR)]
-            )
+    print("")
+    if update:
+        # Keep entries for assets not present in this run (e.g. _framework before publish)
+        merged = dict(baseline)
+        merged.update(current)
+        with open(SIZE_BASELINE_FILE, 'w') as f:
+            json.dump({"assets": merged}, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Size baseline updated in {SIZE_BASELINE_FILE} (commit it to apply the new budgets)")
+        return True
+
+    for message in failures:
+        print(f"[FAIL] {message}")
+    if failures:
+        print("If the sizes are intended, run 'python build.py size --update' (after 'publish' for _framework)")
+        print(f"and commit {SIZE_BASELINE_FILE}.")
+        return False
 
-            if publish_result.returncode != 0:
-                print("")
-                print("[FAIL] Publish test failed!")
-                print("This usually indicates pre-rendering errors (e.g., missing @bind-Value).")
-                sys.exit(1)
+    print("[OK] All assets within size budgets")
+    return True
 
-            print("[OK] Publish test passed")
-            print("")
 
-            # Step 3: Run integration tests
-            print("=" * 60)
-            print("STEP 3: Running integration tests...")
-            print("=" * 60)
+def estimate_tokens(text: str) -> int:
+    """Rough LLM token estimate (~4 characters per token)"""
+    return (len(text) + 3) // 4
 
-            # Check if DemoApp is running
-            pid = get_running_pid()
-            was_started = False
 
-            if not pid:
-                print("DemoApp not running. Starting it now...")
-                run_tailwind_css()
-                subprocess.run([dotnet_path, "build", SOLUTION_PATH], check=True)
-                start_background(dotnet_path)
-                was_started = True
-                print("Waiting for DemoApp to be ready...")
-                time.sleep(5)
+def build_llms_context(force: bool = False, check: bool = False) -> bool:
+    """Build llms-ctx.md from llms-docs/project.md and the numbered sections
 
-            try:
-                integration_test_args = [dotnet_path, "test", TEST_PROJECT, "--filter", "Category=Integration"]
-                integration_result = subprocess.run(integration_test_args)
+    Sections are concatenated in file name order. The output is only rewritten
+    when a section's hash differs from the manifest of the previous run.
 
-                if integration_result.returncode != 0:
-                    print("[FAIL] Integration tests failed")
-                    sys.exit(1)
+    Args:
+        force: Rewrite the output even if nothing changed
+        check: Only compare the committed llms-ctx.md with the generated output;
+            writes nothing and ignores the manifest (used by CI)
 
-                print("[OK] Integration tests passed")
-            finally:
-                if was_started:
-                    print("Stopping DemoApp...")
-                    stop_background()
+    Returns:
+        True if llms-ctx.md was (re)written, or with check, if it is stale
+    """
+    import hashlib
+    import json
 
-            print("")
-            print("=" * 60)
-            print("[OK] All tests passed!")
-            print("=" * 60)
+    project_file = LLMS_DOCS_DIR / "project.md"
+    if not project_file.exists():
+        print(f"[FAIL] Project file not found: {project_file}")
+        sys.exit(1)
 
+    previous: Dict[str, str] = {}
+    previous_output = None
+    if not check and LLMS_MANIFEST_FILE.exists():
+        try:
+            with open(LLMS_MANIFEST_FILE, 'r') as f:
+                manifest = json.load(f)
+            previous = manifest.get("sections", {})
+            previous_output = manifest.get("output")
+        except (ValueError, IOError) as e:
+            print(f"[WARN] Ignoring unreadable docs manifest {LLMS_MANIFEST_FILE}: {e}")
+
+    sources = [project_file] + sorted((LLMS_DOCS_DIR / "sections").glob("*.md"))
+    hashes: Dict[str, str] = {}
+    texts: Dict[str, str] = {}
+
+    print(f"{'Section':<32} {'Size':>10} {'~Tokens':>8}  Status")
+    print("-" * 62)
+    for path in sources:
+        data = path.read_bytes()
+        name = path.relative_to(LLMS_DOCS_DIR).as_posix()
+        hashes[name] = hashlib.sha256(data).hexdigest()
+        texts[name] = data.decode("utf-8").replace("\r\n", "\n")
+
+        if check or previous.get(name) == hashes[name]:
+            status = ""
+        elif name not in previous:
+            status = "new"
         else:
-            print(f"Unknown command: {command}")
-            print_usage()
+            status = "changed"
+        print(f"{name:<32} {format_size(len(data)):>10} {estimate_tokens(texts[name]):>8}  {status}")
+
+    removed = sorted(set(previous) - set(hashes))
+    for name in removed:
+        print(f"{name:<32} {'':>10} {'':>8}  removed")
+    print("")
+
+    existing = LLMS_CTX_FILE.read_bytes() if LLMS_CTX_FILE.exists() else None
+    existing_hash = hashlib.sha256(existing).hexdigest() if existing is not None else None
+    if not force and not check and previous == hashes and previous_output == existing_hash:
+        print(f"[OK] {LLMS_CTX_FILE} is up to date")
+        return False
+
+    # Project wrapper, then <docs> with every section; each part is followed by a newline
+    parts = [texts["project.md"], "\n<docs>\n"]
+    for name in hashes:
+        if name != "project.md":
+            parts += [texts[name], "\n"]
+    parts += ["</docs>\n", "</project>\n"]
+    content = "".join(part + "\n" for part in parts).encode("utf-8")
+    output_hash = hashlib.sha256(content).hexdigest()
+
+    if check:
+        if output_hash != existing_hash:
+            print(f"[FAIL] {LLMS_CTX_FILE} is stale; run 'python build.py docs' and commit it")
+            return True
+        print(f"[OK] {LLMS_CTX_FILE} matches {LLMS_DOCS_DIR}")
+        return False
+
+    # Leave the file (and its timestamp) alone if the output is already identical
+    written = force or output_hash != existing_hash
+    if written:
+        LLMS_CTX_FILE.write_bytes(content)
+
+    with open(LLMS_MANIFEST_FILE, 'w') as f:
+        json.dump({"sections": hashes, "output": output_hash}, f, indent=2)
+        f.write("\n")
+
+    if written:
+        print(f"[OK] Wrote {LLMS_CTX_FILE} ({format_size(len(content))}, "
+              f"~{estimate_tokens(content.decode('utf-8'))} tokens)")
+    else:
+        print(f"[OK] {LLMS_CTX_FILE} is up to date")
+    return written
+
+
+# Regex sources; compiled (and cached by re) on first use
+LINK_PATTERN = r'(?i)(?:href|src)\s*=\s*["\']([^"\'#][^"\']*)["\']'
+MARKDOWN_LINK_PATTERN = r'\]\(([^)\s]+)\)'
+BASE_HREF_PATTERN = r'(?i)<base\s+href\s*=\s*["\']([^"\']+)["\']'
+SUBRESOURCE_PATTERN = (
+    r'(?i)<(?:script|img|source|iframe)\b[^>]*\ssrc\s*=|<link\b[^>]*\srel\s*=\s*["\']?(?:stylesheet|icon|preload|modulepreload)'
+)
+
+
+def extract_links(url: str, body: str, content_type: str) -> List[str]:
+    """Return same-site URLs referenced by an HTML or markdown document"""
+    import urllib.parse
+
+    if "html" in content_type:
+        base_match = re.search(BASE_HREF_PATTERN, body)
+        base = urllib.parse.urljoin(url, base_match.group(1)) if base_match else url
+        candidates = re.findall(LINK_PATTERN, body)
+    elif url.endswith((".md", ".txt")):
+        base = url
+        candidates = re.findall(MARKDOWN_LINK_PATTERN, body)
+    else:
+        return []
+
+    root = urllib.parse.urlsplit(url)
+    links = []
+    for candidate in candidates:
+        if candidate.startswith(("mailto:", "tel:", "javascript:", "data:")):
+            continue
+        target = urllib.parse.urlsplit(urllib.parse.urljoin(base, candidate))
+        if target.scheme not in ("http", "https") or target.netloc != root.netloc:
+            continue
+        links.append(urllib.parse.urlunsplit((target.scheme, target.netloc, target.path or "/", "", "")))
+    return links
+
+
+def fetch_page(url: str) -> Dict:
+    """Fetch a URL and record status, size, subresource count and time to first byte"""
+    import urllib.error
+    import urllib.request
+
+    result = {"url": url, "status": None, "bytes": 0, "subresources": 0, "ttfb_ms": None, "links": []}
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=30) as response:
+            result["ttfb_ms"] = round((time.perf_counter() - start) * 1000, 1)
+            result["status"] = response.status
+            content_type = response.headers.get("Content-Type", "")
+            final_url = response.geturl()
+            body = response.read()
+    except urllib.error.HTTPError as e:
+        result["ttfb_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        result["status"] = e.code
+        return result
+    except (urllib.error.URLError, OSError) as e:
+        result["error"] = str(e)
+        return result
+
+    result["bytes"] = len(body)
+    result["html"] = "html" in content_type
+    if result["html"] or url.endswith((".md", ".txt")):
+        text = body.decode("utf-8", errors="replace")
+        result["links"] = extract_links(final_url, text, content_type)
+        if result["html"]:
+            result["subresources"] = len(re.findall(SUBRESOURCE_PATTERN, text))
+    return result
+
+
+def crawl_published_site(workers: int = CRAWL_WORKERS) -> bool:
+    """Serve dist/wwwroot locally and crawl every route and internal link
+
+    Reports broken routes, missing assets, missing llms-docs files and pages over
+    CRAWL_HEAVY_PAGE_BYTES, and records per-page response size, subresource count
+    and time to first byte.
+
+    Returns:
+        True if every crawled URL responded successfully and no page is too heavy
+    """
+    site_root = DIST_DIR / "wwwroot"
+    if not site_root.is_dir():
+        print(f"[FAIL] Published site not found at {site_root}")
+        return False
+
+    import functools
+    import json
+    import threading
+    from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+    from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+    class QuietHTTPRequestHandler(SimpleHTTPRequestHandler):
+        """Static file handler that does not log every request to stderr"""
+
+        def log_message(self, format, *args) -> None:
+            pass
+
+    class CrawlHTTPServer(ThreadingHTTPServer):
+        """Local static server sized for concurrent crawl connections
+
+        The default listen backlog (5) drops connections under a parallel crawl,
+        which shows up as ~1s TCP retransmit delays in the TTFB metrics.
+        """
+
+        daemon_threads = True
+        request_queue_size = 128
+
+    handler = functools.partial(QuietHTTPRequestHandler, directory=str(site_root))
+    server = CrawlHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    origin = f"http://127.0.0.1:{server.server_address[1]}"
+
+    # Seed with the home page plus every LLM doc that should be shipped
+    seeds = [f"{origin}/", f"{origin}/llms.txt", f"{origin}/llms-ctx.md"]
+    seeds += [f"{origin}/llms-docs/{path.relative_to(LLMS_DOCS_DIR).as_posix()}"
+              for path in sorted(LLMS_DOCS_DIR.rglob("*.md"))]
+
+    print(f"Crawling {origin} with {workers} workers...")
+    started = time.perf_counter()
+    results: List[Dict] = []
+    referrers: Dict[str, str] = {}
+    seen = set(seeds)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending = {pool.submit(fetch_page, url) for url in seeds}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    results.append(result)
+                    for link in result.pop("links"):
+                        if link not in seen:
+                            seen.add(link)
+                            referrers[link] = result["url"]
+                            pending.add(pool.submit(fetch_page, link))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    elapsed = time.perf_counter() - started
+
+    for result in results:
+        result["url"] = result["url"][len(origin):]
+    for link in list(referrers):
+        referrers[link[len(origin):]] = referrers.pop(link)[len(origin):]
+
+    broken = sorted((r for r in results if r["status"] is None or r["status"] >= 400), key=lambda r: r["url"])
+    pages = sorted((r for r in results if r.pop("html", False)), key=lambda r: r["bytes"], reverse=True)
+    heavy = [page for page in pages if page["bytes"] > CRAWL_HEAVY_PAGE_BYTES]
+
+    print(f"Crawled {len(results)} URL(s) ({len(pages)} page(s)) in {elapsed:.2f}s")
+    print("")
+    print(f"{'Page':<50} {'Size':>10} {'Subres':>7} {'TTFB':>10}")
+    print("-" * 80)
+    for page in pages:
+        print(f"{page['url']:<50} {format_size(page['bytes']):>10} {page['subresources']:>7} "
+              f"{page['ttfb_ms']:>7.1f} ms")
+    print("")
+
+    for page in heavy:
+        print(f"[FAIL] Heavy page: {page['url']} ({format_size(page['bytes'])}, "
+              f"limit {format_size(CRAWL_HEAVY_PAGE_BYTES)})")
+
+    for result in broken:
+        reason = result.get("error") or f"HTTP {result['status']}"
+        source = f" (linked from {referrers[result['url']]})" if result["url"] in referrers else ""
+        print(f"[FAIL] {result['url']}: {reason}{source}")
+
+    with open(CRAWL_REPORT_FILE, 'w') as f:
+        json.dump({"elapsed_s": round(elapsed, 2), "results": sorted(results, key=lambda r: r["url"])}, f, indent=2)
+    print(f"Crawl report saved to {CRAWL_REPORT_FILE}")
+
+    if broken:
+        print(f"[FAIL] {len(broken)} broken route(s)/link(s) found")
+    if heavy:
+        print(f"[FAIL] {len(heavy)} page(s) over {format_size(CRAWL_HEAVY_PAGE_BYTES)}")
+    if broken or heavy:
+        return False
+
+    print("[OK] All routes and links resolved, no heavy pages")
+    return True
+
+
+ICON_PATTERN = (
+    r'(?s)<div class="mb-2[^"]*">.*?<svg[^>]*class="w-6 h-6[^"]*"[^>]*>(.*?)</svg>.*?<span[^>]*text-gray-[45]00[^>]*>([^<]+)</span>'
+)
+ICON_PATH_DATA_PATTERN = r'\bd="([^"]+)"'
+
+ICON_TEMPLATES = {
+    "outline": (
+        "<svg class=\"@CombinedClassNames\"\n"
+        "     fill=\"none\"\n"
+        "     stroke=\"currentColor\"\n"
+        "     viewBox=\"0 0 24 24\"\n"
+        "     xmlns=\"http://www.w3.org/2000/svg\"\n"
+        "     aria-hidden=\"@AriaHidden\"\n"
+        "     @attributes=\"AdditionalAttributes\">\n",
+        "    <path stroke-linecap=\"round\" \n"
+        "          stroke-linejoin=\"round\" \n"
+        "          stroke-width=\"@StrokeWidth\"\n"
+        "          d=\"{}\">\n"
+        "    </path>\n",
+    ),
+    "solid": (
+        "<svg class=\"@CombinedClassNames\"\n"
+        "     fill=\"none\"\n"
+        "     viewBox=\"0 0 24 24\"\n"
+        "     xmlns=\"http://www.w3.org/2000/svg\"\n"
+        "     aria-hidden=\"@AriaHidden\"\n"
+        "     @attributes=\"AdditionalAttributes\">\n",
+        "    <path fill=\"currentColor\"\n"
+        "          fill-rule=\"evenodd\"\n"
+        "          clip-rule=\"evenodd\"\n"
+        "          d=\"{}\">\n"
+        "    </path>\n",
+    ),
+}
+
+
+def to_pascal_case(text: str) -> str:
+    """Convert a kebab-case icon name to PascalCase (angle-down -> AngleDown)"""
+    return "".join(part[:1].upper() + part[1:].lower() for part in text.split("-") if part)
+
+
+def render_icon_component(path_data: List[str], style: str) -> str:
+    """Render the .razor source for one icon (same layout as Generate-Icons.ps1)"""
+    svg_open, path_template = ICON_TEMPLATES[style]
+    paths = "".join(path_template.format(d) for d in path_data)
+    return (
+        "\ufeff"
+        f"@namespace {EXTENDED_ICONS_NAMESPACE}\n"
+        "@inherits Flowbite.Base.IconBase\n"
+        "\n"
+        f"{svg_open}{paths}</svg>\n"
+    )
+
+
+def is_generated_icon(data: bytes) -> bool:
+    """Check whether a .razor file has the exact layout render_icon_component emits
+
+    Hand-written icons (no BOM, different <svg> attributes) never match, so
+    --prune leaves them alone.
+    """
+    text = data.decode("utf-8", errors="replace")
+    header = (
+        "\ufeff"
+        f"@namespace {EXTENDED_ICONS_NAMESPACE}\n"
+        "@inherits Flowbite.Base.IconBase\n"
+        "\n"
+    )
+    if not text.startswith(header) or not text.endswith("</svg>\n"):
+        return False
+    body = text[len(header):]
+    return any(body.startswith(svg_open) for svg_open, _ in ICON_TEMPLATES.values())
+
+
+def generate_icons_from_snippet(snippet: Path, style: str) -> Tuple[Dict[str, str], List[str]]:
+    """Parse one saved Flowbite icons HTML snippet (runs in a worker process)
+
+    Returns:
+        Tuple of (component file name -> content, warnings)
+    """
+    html = snippet.read_text(encoding="utf-8", errors="replace")
+    components: Dict[str, str] = {}
+    warnings: List[str] = []
+
+    for svg_content, icon_name in re.findall(ICON_PATTERN, html):
+        icon_name = icon_name.strip()
+        path_data = re.findall(ICON_PATH_DATA_PATTERN, svg_content)
+        if not path_data:
+            warnings.append(f"No path data found for icon: {icon_name} ({snippet.name})")
+            continue
+        components[f"{to_pascal_case(icon_name)}Icon.razor"] = render_icon_component(path_data, style)
+
+    return components, warnings
+
+
+def detect_icon_style(snippet: Path, default: Optional[str]) -> Optional[str]:
+    """Infer outline/solid from the snippet file name, falling back to default"""
+    name = snippet.name.lower()
+    for style in ICON_TEMPLATES:
+        if style in name:
+            return style
+    return default
+
+
+def generate_icons(snippets: List[Path], style: Optional[str] = None, prune: bool = False) -> None:
+    """Generate ExtendedIcons components from saved Flowbite icon HTML snippets
+
+    Snippets are parsed across a process pool and only files whose content
+    changed are written, so MSBuild incremental compilation is not defeated.
+
+    Args:
+        snippets: HTML snippet files (default: every *.html in ICON_SNIPPETS_DIR)
+        style: Icon style for snippets whose file name has no outline/solid hint
+        prune: Delete generated *Icon.razor files that no snippet produces
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    if not snippets:
+        snippets = sorted(ICON_SNIPPETS_DIR.glob("*.html"))
+    if not snippets:
+        print(f"No icon snippets found in {ICON_SNIPPETS_DIR}")
+        print("Save the Flowbite icons HTML there, or pass snippet files explicitly")
+        sys.exit(1)
+
+    jobs: List[Tuple[Path, str]] = []
+    for snippet in snippets:
+        if not snippet.is_file():
+            print(f"[FAIL] Snippet file not found: {snippet}")
+            sys.exit(1)
+        snippet_style = detect_icon_style(snippet, style)
+        if snippet_style is None:
+            print(f"[FAIL] Cannot tell outline/solid from '{snippet.name}'. Use --style outline|solid")
             sys.exit(1)
+        jobs.append((snippet, snippet_style))
+
+    started = time.perf_counter()
+    generated: Dict[str, str] = {}
+    sources: Dict[str, Path] = {}
+    collisions: List[str] = []
+    with ProcessPoolExecutor() as pool:
+        for (snippet, snippet_style), (components, warnings) in zip(
+                jobs, pool.map(generate_icons_from_snippet, *zip(*jobs))):
+            print(f"  {snippet.name}: {len(components)} icon(s) ({snippet_style})")
+            for warning in warnings:
+                print(f"  [WARN] {warning}")
+            for file_name, content in components.items():
+                # Outline and solid sets share icon names, so the same component can come from two snippets
+                if file_name in sources:
+                    collisions.append(f"{file_name}: {sources[file_name].name} and {snippet.name}")
+                    continue
+                sources[file_name] = snippet
+                generated[file_name] = content
+
+    if collisions:
+        print("")
+        for collision in collisions:
+            print(f"[FAIL] {collision}")
+        print(f"[FAIL] {len(collisions)} icon(s) produced by more than one snippet; nothing was written.")
+        print("Keep only the snippet with the style you want for these icons, or pass snippets explicitly")
+        sys.exit(1)
 
-    except KeyboardInterrupt:
-        print("\n\nShutdown requested. Exiting cleanly...")
-        sys.exit(0)
+    if not generated:
+        print("[WARN] No icons found in snippet files")
+        return
 
-    except subprocess.CalledProcessError:
-        print(f"Error: Failed to {command}")
+    added: List[str] = []
+    changed: List[str] = []
+    for file_name, content in sorted(generated.items()):
+        target = EXTENDED_ICONS_DIR / file_name
+        data = content.encode("utf-8")
+        if not target.exists():
+            added.append(file_name)
+        elif target.read_bytes() != data:
+            changed.append(file_name)
+        else:
+            continue
+        target.write_bytes(data)
+
+    # Only files the generator produced are candidates; hand-written icons are never pruned
+    stale = sorted(
+        path.name for path in EXTENDED_ICONS_DIR.glob("*Icon.razor")
+        if path.name not in generated and is_generated_icon(path.read_bytes())
+    )
+    if prune:
+        for file_name in stale:
+            (EXTENDED_ICONS_DIR / file_name).unlink()
+
+    elapsed = time.perf_counter() - started
+    unchanged = len(generated) - len(added) - len(changed)
+    print("")
+    print(f"Generated {len(generated)} icon(s) in {elapsed:.2f}s: "
+          f"{len(added)} added, {len(changed)} changed, {unchanged} unchanged")
+    for file_name in added:
+        print(f"  + {file_name}")
+    for file_name in changed:
+        print(f"  ~ {file_name}")
+    if prune:
+        for file_name in stale:
+            print(f"  - {file_name}")
+        if stale:
+            print(f"{len(stale)} icon(s) removed")
+    elif stale:
+        print(f"{len(stale)} generated icon(s) not in these snippets were kept (use --prune to delete)")
+
+
+def snapshot_sources(roots: List[Path]) -> Dict[Path, float]:
+    """Return modification times of watched source files under the given roots"""
+    snapshot: Dict[Path, float] = {}
+    for root in roots:
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d not in TEST_WATCH_SKIP_DIRS]
+            for filename in filenames:
+                if filename.endswith(TEST_WATCH_EXTENSIONS):
+                    path = Path(dirpath) / filename
+                    try:
+                        snapshot[path] = path.stat().st_mtime
+                    except OSError:
+                        continue
+    return snapshot
+
+
+def index_test_classes() -> Dict[str, Dict]:
+    """Map unit test class names to their namespace, file and source text"""
+    index: Dict[str, Dict] = {}
+    for path in TEST_DIR.rglob("*Tests.cs"):
+        if any(part in TEST_WATCH_SKIP_DIRS for part in path.parts):
+            continue
+        text = path.read_text(encoding="utf-8", errors="replace")
+        namespace = re.search(r'^namespace\s+([\w.]+)', text, re.MULTILINE)
+        if not namespace or namespace.group(1).endswith(".Integration"):
+            continue
+        for class_name in re.findall(r'^public\s+(?:sealed\s+)?class\s+(\w+Tests)\b', text, re.MULTILINE):
+            index[class_name] = {"namespace": namespace.group(1), "path": path, "text": text}
+    return index
+
+
+def find_affected_tests(changed: List[Path], index: Dict[str, Dict]) -> Optional[List[str]]:
+    """Pick the test classes affected by a set of changed files
+
+    Heuristics, per changed file:
+    - a test file reruns its own classes; Integration/ files rerun nothing
+    - a source file reruns `<Name>Tests` and any test class that references `Name`
+    - anything else (no mapped tests) reruns everything rather than nothing
+
+    Returns:
+        Fully qualified test class names, or None when everything should rerun
+        (project files, base classes, shared test setup such as TestSetup/,
+        sources no test maps to)
+    """
+    affected = set()
+    for path in changed:
+        if path.suffix in (".csproj", ".props", ".targets") or path.name in ("_Imports.razor", "GlobalUsings.cs"):
+            return None
+
+        parts = path.parts
+        in_tests = TEST_DIR.name in parts
+        if in_tests:
+            if "Integration" in parts:
+                # Integration tests are excluded from watch runs and nothing else depends on them
+                continue
+            classes = [name for name, info in index.items() if info["path"] == path]
+            if not classes:
+                # Shared fixtures/helpers (e.g. TestSetup) can affect every test
+                return None
+            affected.update(f"{index[name]['namespace']}.{name}" for name in classes)
+            continue
+
+        if "Base" in parts:
+            return None
+
+        name = path.name.split(".")[0]
+        reference = re.compile(rf'\b{re.escape(name)}\b')
+        matches = [
+            class_name for class_name, info in index.items()
+            if class_name == f"{name}Tests" or reference.search(info["text"])
+        ]
+
+        if not matches:
+            # Sharing a folder/namespace says nothing about coverage; be safe
+            return None
+
+        affected.update(f"{index[class_name]['namespace']}.{class_name}" for class_name in matches)
+
+    return sorted(affected)
+
+
+def watch_tests(dotnet_path: str, filter_value: Optional[str] = None) -> None:
+    """Rerun unit tests whenever Flowbite or test sources change
+
+    Changes are debounced, then only the affected test classes are rerun
+    (see find_affected_tests). With an explicit filter, that filter is rerun
+    on every change instead.
+    """
+    import subprocess
+
+    roots = [FLOWBITE_DIR, TEST_DIR]
+
+    def run_tests(test_filter: str, restore: bool) -> None:
+        test_args = [dotnet_path, "test", TEST_PROJECT, "--filter", test_filter]
+        if not restore:
+            test_args.append("--no-restore")
+        started = time.perf_counter()
+        result = subprocess.run(test_args)
+        status = "[OK] Tests passed" if result.returncode == 0 else "[FAIL] Tests failed"
+        print(f"{status} in {time.perf_counter() - started:.1f}s")
+        print(f"Watching {', '.join(str(r) for r in roots)} for changes... (Ctrl+C to stop)")
+
+    run_tests(filter_value or "Category!=Integration", restore=True)
+    snapshot = snapshot_sources(roots)
+    index = index_test_classes()
+
+    while True:
+        time.sleep(TEST_WATCH_INTERVAL)
+        current = snapshot_sources(roots)
+        if current == snapshot:
+            continue
+
+        # Debounce: wait until the burst of saves (editor, formatter, git) settles
+        while True:
+            time.sleep(TEST_WATCH_DEBOUNCE)
+            settled = snapshot_sources(roots)
+            if settled == current:
+                break
+            current = settled
+
+        changed = sorted(
+            {path for path in current if snapshot.get(path) != current[path]} |
+            {path for path in snapshot if path not in current}
+        )
+        snapshot = current
+
+        print("")
+        print(f"Changed: {', '.join(str(path) for path in changed[:5])}"
+              + (f" (+{len(changed) - 5} more)" if len(changed) > 5 else ""))
+
+        if filter_value:
+            run_tests(filter_value, restore=False)
+            continue
+
+        if any(TEST_DIR in path.parents for path in changed):
+            index = index_test_classes()
+
+        affected = find_affected_tests(changed, index)
+        if affected is None:
+            print("Shared code changed, rerunning all unit tests...")
+            run_tests("Category!=Integration", restore=False)
+        elif affected:
+            print(f"Rerunning {', '.join(name.rsplit('.', 1)[-1] for name in affected)}...")
+            names = "|".join(f"FullyQualifiedName~{name}" for name in affected)
+            run_tests(f"({names})&Category!=Integration", restore=False)
+        else:
+            print("No affected unit tests")
+
+
+def command_build(dotnet_path: str, args: List[str]) -> None:
+    """Stop any running DemoApp, build Tailwind CSS, then build the solution"""
+    import subprocess
+
+    # Auto-stop any running application to prevent file lock issues
+    # (a port check also catches a DemoApp child left behind by a dead launcher)
+    if PID_FILE.exists() or is_port_in_use(DEMOAPP_PORT):
+        print("Stopping running DemoApp before build...")
+        stop_background()
+
+    # Run Tailwind CSS before dotnet build
+    run_tailwind_css()
+
+    print("Building solution...")
+    subprocess.run(
+        [dotnet_path, "build", SOLUTION_PATH],
+        check=True
+    )
+    print("[OK] Successfully built solution")
+
+
+def command_watch(dotnet_path: str, args: List[str]) -> None:
+    """Run DemoApp with hot reload (foreground)"""
+    import subprocess
+
+    print("Starting DemoApp with hot reload...")
+    print("Press Ctrl+C to stop watching...")
+
+    env = os.environ.copy()
+    env["ASPNETCORE_ENVIRONMENT"] = "Development"
+
+    subprocess.run(
+        [dotnet_path, "watch", "--project", PROJECT_PATH, "--no-restore"],
+        env=env
+    )
+
+
+def command_run(dotnet_path: str, args: List[str]) -> None:
+    """Run DemoApp (foreground)"""
+    import subprocess
+
+    print("Running DemoApp...")
+    print("Press Ctrl+C to stop...")
+
+    env = os.environ.copy()
+    env["ASPNETCORE_ENVIRONMENT"] = "Development"
+
+    subprocess.run(
+        [dotnet_path, "run", "--project", PROJECT_PATH, "--no-restore"],
+        env=env
+    )
+
+
+def command_start(dotnet_path: str, args: List[str]) -> None:
+    """Build and start DemoApp in the background"""
+    import subprocess
+
+    # Auto-stop any running application
+    # (a port check also catches a DemoApp child left behind by a dead launcher)
+    if PID_FILE.exists() or is_port_in_use(DEMOAPP_PORT):
+        print("Stopping running DemoApp before build...")
+        stop_background()
+
+    # Run Tailwind CSS before dotnet build
+    run_tailwind_css()
+
+    # Auto-build before starting
+    print("Building solution before start...")
+    subprocess.run(
+        [dotnet_path, "build", SOLUTION_PATH],
+        check=True
+    )
+    start_background(dotnet_path)
+
+
+def command_pack(dotnet_path: str, args: List[str]) -> None:
+    """Create NuGet packages in NUGET_LOCAL_DIR"""
+    import subprocess
+
+    # Pack NuGet packages (like publish-local.ps1)
+    print(f"Creating NuGet packages in {NUGET_LOCAL_DIR}...")
+    NUGET_LOCAL_DIR.mkdir(parents=True, exist_ok=True)
+
+    # Pack Flowbite
+    print("Packing Flowbite...")
+    subprocess.run(
+        [dotnet_path, "pack", FLOWBITE_PROJECT, "-c", "Release", "-o", str(NUGET_LOCAL_DIR)],
+        check=True
+    )
+
+    # Pack Flowbite.ExtendedIcons
+    print("Packing Flowbite.ExtendedIcons...")
+    subprocess.run(
+        [dotnet_path, "pack", EXTENDED_ICONS_PROJECT, "-c", "Release", "-o", str(NUGET_LOCAL_DIR)],
+        check=True
+    )
+
+    print(f"[OK] NuGet packages created in {NUGET_LOCAL_DIR}")
+
+
+def command_publish(dotnet_path: str, args: List[str]) -> None:
+    """Build docs, pack NuGet packages, publish DemoApp, check asset sizes and crawl it"""
+    import subprocess
+
+    # Full publish flow: docs + pack + publish demo
+    print(f"Publishing solution...")
+
+    print("Building LLM documentation context...")
+    build_llms_context()
+    print("")
+
+    # Pack NuGet packages first
+    NUGET_LOCAL_DIR.mkdir(parents=True, exist_ok=True)
+
+    print("Packing Flowbite...")
+    subprocess.run(
+        [dotnet_path, "pack", FLOWBITE_PROJECT, "-c", "Release", "-o", str(NUGET_LOCAL_DIR)],
+        check=True
+    )
+
+    print("Packing Flowbite.ExtendedIcons...")
+    subprocess.run(
+        [dotnet_path, "pack", EXTENDED_ICONS_PROJECT, "-c", "Release", "-o", str(NUGET_LOCAL_DIR)],
+        check=True
+    )
+
+    print(f"[OK] NuGet packages created in {NUGET_LOCAL_DIR}")
+
+    # Publish DemoApp
+    print(f"Publishing DemoApp to {DIST_DIR}...")
+
+    # Clean dist directory
+    if DIST_DIR.exists():
+        import shutil
+        shutil.rmtree(DIST_DIR)
+
+    subprocess.run(
+        [dotnet_path, "publish", PROJECT_PATH, "-c", "Release", "-o", str(DIST_DIR)],
+        check=True
+    )
+
+    print(f"[OK] Successfully published to {DIST_DIR}")
+    print("")
+
+    # Post-publish stage: asset size report and budget check
+    print("Checking asset sizes...")
+    if not report_asset_sizes(require_all=True):
+        print("[FAIL] Asset size budget check failed")
+        sys.exit(1)
+    print("")
+
+    # Crawl the published site to catch broken routes, assets and docs links
+    if not crawl_published_site():
+        sys.exit(1)
+    print("")
+
+    print("To serve locally:")
+    print("  1. Ensure you have dotnet-serve installed: dotnet tool install -g dotnet-serve")
+    print(f"  2. Run: cd {DIST_DIR}/wwwroot && dotnet serve")
+
+
+def command_test(dotnet_path: str, args: List[str]) -> None:
+    """Run unit tests (excluding integration tests), optionally in watch mode"""
+    import subprocess
+
+    # Run unit tests (excluding integration tests)
+    print("Running unit tests...")
+
+    # Build test arguments
+    test_args = [dotnet_path, "test", TEST_PROJECT]
+
+    # Parse additional arguments
+    filter_value = None
+    watch = False
+
+    i = 0
+    while i < len(args):
+        if args[i] == "--filter" and i + 1 < len(args):
+            filter_value = args[i + 1]
+            i += 2
+        elif args[i] == "--watch":
+            watch = True
+            i += 1
+        elif not args[i].startswith("--"):
+            # Treat as filter value if no --filter prefix
+            filter_value = args[i]
+            i += 1
+        else:
+            i += 1
+
+    if watch:
+        watch_tests(dotnet_path, filter_value)
+        return
+
+    # Apply filter (exclude integration tests by default unless specific filter given)
+    if filter_value:
+        test_args.extend(["--filter", filter_value])
+    else:
+        test_args.extend(["--filter", "Category!=Integration"])
+
+    subprocess.run(test_args, check=True)
+    print("[OK] Unit tests completed")
+
+
+def command_test_integration(dotnet_path: str, args: List[str]) -> None:
+    """Run integration tests, starting DemoApp if needed"""
+    import subprocess
+
+    # Run integration tests (requires DemoApp to be running)
+    print("Running integration tests...")
+
+    # Check if DemoApp is running
+    pid = get_running_pid()
+    was_started = False
+
+    if not pid:
+        print("DemoApp not running. Starting it now...")
+        # Build and start
+        run_tailwind_css()
+        subprocess.run([dotnet_path, "build", SOLUTION_PATH], check=True)
+        start_background(dotnet_path)
+        was_started = True
+        # Wait for app to be ready
+        print("Waiting for DemoApp to be ready...")
+        time.sleep(5)
+
+    try:
+        # Run integration tests
+        test_args = [dotnet_path, "test", TEST_PROJECT, "--filter", "Category=Integration"]
+        subprocess.run(test_args, check=True)
+        print("[OK] Integration tests completed")
+    finally:
+        # Stop DemoApp if we started it
+        if was_started:
+            print("Stopping DemoApp...")
+            stop_background()
+
+
+def command_test_publish(dotnet_path: str, args: List[str]) -> None:
+    """Publish as a test to catch pre-rendering errors, then crawl the output"""
+    import subprocess
+
+    # Run publish as a test to catch pre-rendering errors
+    print("Testing publish process (catches pre-rendering errors)...")
+    print("")
+
+    print("Building LLM documentation context...")
+    build_llms_context()
+    print("")
+
+    # Pack NuGet packages first
+    NUGET_LOCAL_DIR.mkdir(parents=True, exist_ok=True)
+
+    print("Packing Flowbite...")
+    pack_result = subprocess.run(
+        [dotnet_path, "pack", FLOWBITE_PROJECT, "-c", "Release", "-o", str(NUGET_LOCAL_DIR)]
+    )
+    if pack_result.returncode != 0:
+        print("[FAIL] Flowbite pack failed")
+        sys.exit(1)
+
+    print("Packing Flowbite.ExtendedIcons...")
+    pack_ext_result = subprocess.run(
+        [dotnet_path, "pack", EXTENDED_ICONS_PROJECT, "-c", "Release", "-o", str(NUGET_LOCAL_DIR)]
+    )
+    if pack_ext_result.returncode != 0:
+        print("[FAIL] Flowbite.ExtendedIcons pack failed")
+        sys.exit(1)
+
+    # Publish DemoApp (this runs pre-rendering which catches binding errors)
+    print(f"Publishing DemoApp to {DIST_DIR} (with pre-rendering)...")
+
+    # Clean dist directory
+    if DIST_DIR.exists():
+        import shutil
+        shutil.rmtree(DIST_DIR)
+
+    publish_result = subprocess.run(
+        [dotnet_path, "publish", PROJECT_PATH, "-c", "Release", "-o", str(DIST_DIR)]
+    )
+
+    if publish_result.returncode != 0:
+        print("")
+        print("[FAIL] Publish test failed!")
+        print("This usually indicates pre-rendering errors (e.g., missing @bind-Value).")
+        print("Check the error output above for details.")
+        sys.exit(1)
+
+    print("")
+    print("[OK] Publish test passed - all pages pre-rendered successfully")
+    print("")
+
+    # Crawl the published site to catch broken routes, assets and docs links
+    if not crawl_published_site():
+        sys.exit(1)
+
+
+def command_test_all(dotnet_path: str, args: List[str]) -> None:
+    """Run unit tests, the publish test, then integration tests"""
+    import subprocess
+
+    # Run all tests: unit tests, publish test, then integration tests
+    print("Running all tests (unit + publish + integration)...")
+    print("")
+
+    # Step 1: Run unit tests
+    print("=" * 60)
+    print("STEP 1: Running unit tests...")
+    print("=" * 60)
+    unit_test_args = [dotnet_path, "test", TEST_PROJECT, "--filter", "Category!=Integration"]
+    unit_result = subprocess.run(unit_test_args)
+
+    if unit_result.returncode != 0:
+        print("[FAIL] Unit tests failed")
+        sys.exit(1)
+
+    print("[OK] Unit tests passed")
+    print("")
+
+    # Step 2: Run publish test (catches pre-rendering errors)
+    print("=" * 60)
+    print("STEP 2: Running publish test (pre-rendering validation)...")
+    print("=" * 60)
+
+    print("Building LLM documentation context...")
+    build_llms_context()
+    print("")
+
+    NUGET_LOCAL_DIR.mkdir(parents=True, exist_ok=True)
+
+    print("Packing Flowbite...")
+    pack_result = subprocess.run(
+        [dotnet_path, "pack", FLOWBITE_PROJECT, "-c", "Release", "-o", str(NUGET_LOCAL_DIR)]
+    )
+    if pack_result.returncode != 0:
+        print("[FAIL] Flowbite pack failed")
+        sys.exit(1)
+
+    print("Packing Flowbite.ExtendedIcons...")
+    pack_ext_result = subprocess.run(
+        [dotnet_path, "pack", EXTENDED_ICONS_PROJECT, "-c", "Release", "-o", str(NUGET_LOCAL_DIR)]
+    )
+    if pack_ext_result.returncode != 0:
+        print("[FAIL] Flowbite.ExtendedIcons pack failed")
         sys.exit(1)
 
+    if DIST_DIR.exists():
+        import shutil
+        shutil.rmtree(DIST_DIR)
+
+    publish_result = subprocess.run(
+        [dotnet_path, "publish", PROJECT_PATH, "-c", "Release", "-o", str(DIST_DIR)]
+    )
+
+    if publish_result.returncode != 0:
+        print("")
+        print("[FAIL] Publish test failed!")
+        print("This usually indicates pre-rendering errors (e.g., missing @bind-Value).")
+        sys.exit(1)
+
+    print("[OK] Publish test passed")
+    print("")
+
+    if not crawl_published_site():
+        sys.exit(1)
+    print("")
+
+    # Step 3: Run integration tests
+    print("=" * 60)
+    print("STEP 3: Running integration tests...")
+    print("=" * 60)
+
+    # Check if DemoApp is running
+    pid = get_running_pid()
+    was_started = False
+
+    if not pid:
+        print("DemoApp not running. Starting it now...")
+        run_tailwind_css()
+        subprocess.run([dotnet_path, "build", SOLUTION_PATH], check=True)
+        start_background(dotnet_path)
+        was_started = True
+        print("Waiting for DemoApp to be ready...")
+        time.sleep(5)
+
+    try:
+        integration_test_args = [dotnet_path, "test", TEST_PROJECT, "--filter", "Category=Integration"]
+        integration_result = subprocess.run(integration_test_args)
+
+        if integration_result.returncode != 0:
+            print("[FAIL] Integration tests failed")
+            sys.exit(1)
+
+        print("[OK] Integration tests passed")
+    finally:
+        if was_started:
+            print("Stopping DemoApp...")
+            stop_background()
+
+    print("")
+    print("=" * 60)
+    print("[OK] All tests passed!")
+    print("=" * 60)
+
 
 def search_log(pattern: Optional[str] = None, tail: int = 0, level: Optional[str] = None) -> None:
     """Search or tail the log file
@@ -713,20 +1769,32 @@ def print_usage() -> None:
     print("  build        - Build the solution (default)")
     print("  watch        - Run DemoApp with hot reload (foreground)")
     print("  run          - Run DemoApp (foreground)")
-    print("  start        - Build & start DemoApp in background (port 5290)")
-    print("  stop         - Stop the background DemoApp")
+    print(f"  start        - Build & start DemoApp in background (port {DEMOAPP_PORT})")
+    print("  stop         - Stop the background DemoApp (whole process tree)")
     print("  status       - Check if DemoApp is running")
     print("")
     print("Package Commands:")
     print("  pack         - Create NuGet packages in nuget-local/")
-    print("  publish      - Pack NuGet + publish DemoApp to dist/")
+    print("  publish      - Docs + pack NuGet + publish DemoApp to dist/ (+ size check, crawl)")
+    print("  docs         - Rebuild llms-ctx.md from llms-docs/ (only if changed)")
+    print("  docs --force - Rebuild llms-ctx.md unconditionally")
+    print("  docs --check - Fail if llms-ctx.md is out of date (writes nothing)")
+    print("  size         - Report asset sizes (raw/gzip/brotli) vs asset-sizes.json")
+    print("  size --update - Write current sizes as the new baseline (commit it)")
+    print("")
+    print("Icon Commands:")
+    print("  icons [snippet.html ...] - Generate ExtendedIcons from Flowbite HTML snippets")
+    print("                             (default: scripts/tmp/*.html, writes only changed files)")
+    print("  icons --style <style>    - Style when not in file name (outline/solid)")
+    print("  icons --prune            - Delete generated *Icon.razor files not in the snippets")
     print("")
     print("Test Commands:")
     print("  test                     - Run unit tests (excludes integration tests)")
     print("  test <filter>            - Run tests matching filter")
     print("  test --filter <filter>   - Run tests matching filter")
+    print("  test --watch             - Rerun affected unit tests on source changes")
     print("  test-integration         - Run Playwright integration tests (auto-starts DemoApp)")
-    print("  test-publish             - Run publish to catch pre-rendering errors")
+    print("  test-publish             - Publish + crawl dist/ for broken routes/links")
     print("  test-all                 - Run all tests (unit + publish + integration)")
     print("")
     print("Log Commands:")
@@ -740,65 +1808,146 @@ def print_usage() -> None:
     print("  python build.py start        # Build and start in background")
     print("  python build.py watch        # Hot reload development")
     print("  python build.py pack         # Create NuGet packages")
+    print("  python build.py size         # Check asset size budgets")
     print("  python build.py test         # Run all unit tests")
     print("  python build.py test DebouncerTests  # Run specific test class")
+    print("  python build.py test --watch         # Continuous test runner")
     print("  python build.py test-integration     # Run E2E tests")
     print("  python build.py test-all     # Run unit + integration tests")
     print("  python build.py log error    # Search for 'error' in logs")
     print("  python build.py log --tail 100 --level warn")
 
 
-def main() -> None:
-    """Main entry point"""
-    command = sys.argv[1] if len(sys.argv) > 1 else "build"
+def command_stop(args: List[str]) -> None:
+    """Stop the background DemoApp"""
+    stop_background()
 
-    # Special commands that don't need setup
-    if command in ["stop", "status"]:
-        if command == "stop":
-            stop_background()
+
+def command_status(args: List[str]) -> None:
+    """Check if the background DemoApp is running"""
+    check_status()
+
+
+def command_log(args: List[str]) -> None:
+    """Search or tail the DemoApp log file"""
+    pattern = None
+    tail = 50  # Default to last 50 lines
+    level = None
+
+    i = 0
+    while i < len(args):
+        if args[i] == "--tail" and i + 1 < len(args):
+            try:
+                tail = int(args[i + 1])
+            except ValueError:
+                print(f"Invalid tail value: {args[i + 1]}")
+                sys.exit(1)
+            i += 2
+        elif args[i] == "--level" and i + 1 < len(args):
+            level = args[i + 1]
+            i += 2
+        elif not args[i].startswith("--"):
+            pattern = args[i]
+            i += 1
         else:
-            check_status()
+            print(f"Unknown option: {args[i]}")
+            print_usage()
+            sys.exit(1)
+
+    search_log(pattern=pattern, tail=tail, level=level)
+
+
+def command_docs(args: List[str]) -> None:
+    """Rebuild llms-ctx.md from llms-docs/ when a section changed, or check it"""
+    if "--check" in args:
+        if build_llms_context(check=True):
+            sys.exit(1)
         return
+    build_llms_context(force="--force" in args)
 
-    # Log command
-    if command == "log":
-        pattern = None
-        tail = 50  # Default to last 50 lines
-        level = None
 
-        args = sys.argv[2:]
-        i = 0
-        while i < len(args):
-            if args[i] == "--tail" and i + 1 < len(args):
-                try:
-                    tail = int(args[i + 1])
-                except ValueError:
-                    print(f"Invalid tail value: {args[i + 1]}")
-                    sys.exit(1)
-                i += 2
-            elif args[i] == "--level" and i + 1 < len(args):
-                level = args[i + 1]
-                i += 2
-            elif not args[i].startswith("--"):
-                pattern = args[i]
-                i += 1
-            else:
-                print(f"Unknown option: {args[i]}")
-                print_usage()
+def command_icons(args: List[str]) -> None:
+    """Generate ExtendedIcons components from Flowbite HTML snippets"""
+    snippets: List[Path] = []
+    style = None
+    prune = False
+
+    i = 0
+    while i < len(args):
+        if args[i] == "--style" and i + 1 < len(args):
+            style = args[i + 1].lower()
+            if style not in ICON_TEMPLATES:
+                print(f"Invalid icon style: {args[i + 1]} (expected outline or solid)")
                 sys.exit(1)
+            i += 2
+        elif args[i] == "--prune":
+            prune = True
+            i += 1
+        elif not args[i].startswith("--"):
+            snippets.append(Path(args[i]))
+            i += 1
+        else:
+            print(f"Unknown option: {args[i]}")
+            print_usage()
+            sys.exit(1)
 
-        search_log(pattern=pattern, tail=tail, level=level)
-        return
+    generate_icons(snippets, style=style, prune=prune)
 
-    if command == "help" or command == "--help" or command == "-h":
-        print_usage()
-        return
 
-    if command not in ["build", "watch", "run", "start", "pack", "publish", "test", "test-integration", "test-publish", "test-all"]:
+def command_size(args: List[str]) -> None:
+    """Report asset sizes and fail if a size budget is exceeded"""
+    if not report_asset_sizes(update="--update" in args):
+        sys.exit(1)
+
+
+def command_help(args: List[str]) -> None:
+    """Print usage information"""
+    print_usage()
+
+
+# Command name -> (handler, needs the .NET SDK and Tailwind CLI)
+# Handlers import their heavy dependencies (psutil, subprocess, http.server, ...)
+# on first use, so read-only commands like `log` and `status` start fast.
+COMMANDS: Dict[str, Tuple[Callable[..., None], bool]] = {
+    "build": (command_build, True),
+    "watch": (command_watch, True),
+    "run": (command_run, True),
+    "start": (command_start, True),
+    "stop": (command_stop, False),
+    "status": (command_status, False),
+    "pack": (command_pack, True),
+    "publish": (command_publish, True),
+    "docs": (command_docs, False),
+    "icons": (command_icons, False),
+    "size": (command_size, False),
+    "test": (command_test, True),
+    "test-integration": (command_test_integration, True),
+    "test-publish": (command_test_publish, True),
+    "test-all": (command_test_all, True),
+    "log": (command_log, False),
+    "help": (command_help, False),
+    "--help": (command_help, False),
+    "-h": (command_help, False),
+}
+
+
+def main() -> None:
+    """Main entry point"""
+    command = sys.argv[1] if len(sys.argv) > 1 else "build"
+    args = sys.argv[2:]
+
+    if command not in COMMANDS:
         print(f"Unknown command: {command}")
         print_usage()
         sys.exit(1)
 
+    handler, needs_dotnet = COMMANDS[command]
+
+    # Commands that don't need setup
+    if not needs_dotnet:
+        handler(args)
+        return
+
     # Setup prerequisites
     print("Setting up build environment...")
     setup_tailwindcss()
@@ -812,7 +1961,17 @@ def main() -> None:
         sys.exit(1)
 
     # Execute command
-    run_dotnet_command(dotnet_path, command)
+    import subprocess
+    try:
+        handler(dotnet_path, args)
+
+    except KeyboardInterrupt:
+        print("\n\nShutdown requested. Exiting cleanly...")
+        sys.exit(0)
+
+    except subprocess.CalledProcessError:
+        print(f"Error: Failed to {command}")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
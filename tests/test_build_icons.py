@@ -0,0 +1,62 @@
+"""
+Tests for build.py's icon generator prune check
+
+`icons --prune` deletes every *Icon.razor that is_generated_icon accepts and
+that the snippets no longer produce, so hand-written icons must never match.
+
+Run with: python -m pytest tests  (or: python -m unittest discover tests)
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import build  # noqa: E402
+
+ICONS_DIR = ROOT / build.EXTENDED_ICONS_DIR
+
+# Icons written by hand (not by Generate-Icons.ps1 / build.py icons)
+HAND_WRITTEN_ICONS = ["ChartPie", "Cube", "ScrollText", "Shapes", "SrcFile", "TestTube2"]
+
+# Committed icons produced by the generator
+GENERATED_ICONS = ["AngleDown", "Annotation", "ApiKey"]
+
+PATH_DATA = ["m8 10 4 4 4-4", "M12 4v16"]
+
+
+class IsGeneratedIconTests(unittest.TestCase):
+    def test_rendered_components_are_recognised(self):
+        for style in build.ICON_TEMPLATES:
+            with self.subTest(style=style):
+                rendered = build.render_icon_component(PATH_DATA, style)
+                self.assertTrue(build.is_generated_icon(rendered.encode("utf-8")))
+
+    def test_committed_generated_icons_are_recognised(self):
+        for name in GENERATED_ICONS:
+            with self.subTest(icon=name):
+                data = (ICONS_DIR / f"{name}Icon.razor").read_bytes()
+                self.assertTrue(build.is_generated_icon(data))
+
+    def test_hand_written_icons_are_not_recognised(self):
+        for name in HAND_WRITTEN_ICONS:
+            with self.subTest(icon=name):
+                data = (ICONS_DIR / f"{name}Icon.razor").read_bytes()
+                self.assertFalse(build.is_generated_icon(data))
+
+    def test_edited_component_is_not_recognised(self):
+        rendered = build.render_icon_component(PATH_DATA, "outline")
+        cases = {
+            "no BOM": rendered.lstrip("\ufeff"),
+            "extra markup": rendered + "<title>Custom</title>\n",
+            "different svg attributes": rendered.replace('fill="none"', 'fill="currentColor"'),
+        }
+        for case, text in cases.items():
+            with self.subTest(case=case):
+                self.assertFalse(build.is_generated_icon(text.encode("utf-8")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Tests for build.py's background DemoApp tracking
+
+`dotnet run` (the launcher in .demoapp.pid) can exit while the DemoApp child it
+started keeps running. `status` must keep the PID file in that case, since
+`stop` needs the launcher's PID to find the child's process group.
+
+Run with: python -m pytest tests  (or: python -m unittest discover tests)
+"""
+
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+BUILD_SCRIPT = Path(__file__).resolve().parent.parent / "build.py"
+
+# Launcher that starts a long-running child, then exits
+LAUNCHER_CODE = (
+    "import subprocess, sys\n"
+    "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'])\n"
+)
+
+
+def run_status(cwd):
+    return subprocess.run(
+        [sys.executable, str(BUILD_SCRIPT), "status"],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+
+@unittest.skipIf(os.name == "nt", "process groups are Unix-only")
+class OrphanedDemoAppTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cwd = self._tmp.name
+        self.pid_file = Path(self.cwd, ".demoapp.pid")
+
+        # Same session setup as start_background(): the launcher's PID is the group ID
+        launcher = subprocess.Popen([sys.executable, "-c", LAUNCHER_CODE], start_new_session=True)
+        launcher.wait(timeout=30)
+        self.pgid = launcher.pid
+        self.pid_file.write_text(str(self.pgid))
+
+    def tearDown(self):
+        try:
+            os.killpg(self.pgid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        self._tmp.cleanup()
+
+    def test_status_keeps_pid_file_while_group_is_alive(self):
+        result = run_status(self.cwd)
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+        self.assertIn(f"launcher (PID: {self.pgid}) has exited", result.stdout)
+        self.assertNotIn("not running", result.stdout)
+        self.assertTrue(self.pid_file.exists())
+
+    def test_status_removes_pid_file_once_group_exits(self):
+        os.killpg(self.pgid, signal.SIGKILL)
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            try:
+                os.killpg(self.pgid, 0)
+            except ProcessLookupError:
+                break
+            time.sleep(0.02)
+
+        result = run_status(self.cwd)
+        self.assertIn("DemoApp is not running", result.stdout)
+        self.assertFalse(self.pid_file.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Startup benchmark for build.py
+
+`status` and `log` are polled by monitoring scripts every few seconds, so
+read-only commands must not pay for heavy imports. Uses `python -X importtime`
+to check which modules each command loads and how long build.py's own imports take.
+
+Run with: python -m pytest tests  (or: python -m unittest discover tests)
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+BUILD_SCRIPT = Path(__file__).resolve().parent.parent / "build.py"
+
+# Modules only process-management, publish or crawl commands should import
+HEAVY_MODULES = {
+    "psutil",
+    "subprocess",
+    "socket",
+    "json",
+    "hashlib",
+    "gzip",
+    "urllib.request",
+    "http.server",
+    "concurrent.futures",
+    "threading",
+}
+
+LIGHT_COMMANDS = ["help", "log", "status"]
+
+# Generous budget for imports done by build.py itself (beyond interpreter startup)
+IMPORT_BUDGET_US = 50_000
+
+
+def run_with_importtime(args, cwd, env=None):
+    """Run python -X importtime, return (process, {module: cumulative_us})"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    imports = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        imports[name.strip()] = (int(cumulative), len(name) - len(name.lstrip()))
+    return result, imports
+
+
+class BuildStartupTests(unittest.TestCase):
+    def setUp(self):
+        # Empty working directory: no log file, and a PID file pointing at this
+        # (live) test process so `status` goes through the running-process check
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cwd = self._tmp.name
+        Path(self.cwd, ".demoapp.pid").write_text(str(os.getpid()))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_light_commands_skip_heavy_imports(self):
+        for command in LIGHT_COMMANDS:
+            with self.subTest(command=command):
+                result, imports = run_with_importtime([str(BUILD_SCRIPT), command], self.cwd)
+                self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+                if command == "status":
+                    self.assertIn(f"DemoApp is running (PID: {os.getpid()})", result.stdout)
+                loaded = HEAVY_MODULES & set(imports)
+                self.assertFalse(loaded, f"'{command}' imported heavy modules: {sorted(loaded)}")
+
+    def test_import_time_within_budget(self):
+        _, baseline = run_with_importtime(["-c", "pass"], self.cwd)
+        _, imports = run_with_importtime([str(BUILD_SCRIPT), "help"], self.cwd)
+
+        # Sum top-level imports that the bare interpreter does not already do
+        own = {
+            name: cumulative for name, (cumulative, depth) in imports.items()
+            if depth == 1 and name not in baseline
+        }
+        total = sum(own.values())
+        self.assertLess(total, IMPORT_BUDGET_US, f"build.py imports took {total} us: {own}")
+
+    def test_light_commands_work_without_psutil(self):
+        with tempfile.TemporaryDirectory() as shim:
+            # A psutil module that fails to import, shadowing any installed copy
+            Path(shim, "psutil.py").write_text("raise ImportError('psutil hidden by test')\n")
+            env = dict(os.environ, PYTHONPATH=shim)
+
+            # `status` only needs psutil on Windows
+            commands = ["help", "log"] + (["status"] if os.name != "nt" else [])
+            for command in commands:
+                with self.subTest(command=command):
+                    result, _ = run_with_importtime([str(BUILD_SCRIPT), command], self.cwd, env)
+                    self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+                    self.assertNotIn("psutil is required", result.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+Tests for build.py's `test --watch` affected-test heuristic
+
+find_affected_tests maps changed files to unit test classes. When no test maps
+to a change it must rerun everything (None), never silently run nothing.
+
+Run with: python -m pytest tests  (or: python -m unittest discover tests)
+"""
+
+import os
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import build  # noqa: E402
+
+SRC = build.FLOWBITE_DIR
+TESTS = build.TEST_DIR
+
+
+def entry(namespace, relative_path, text=""):
+    return {"namespace": namespace, "path": TESTS / relative_path, "text": text}
+
+
+# Synthetic index shaped like index_test_classes() output
+INDEX = {
+    "DebouncerTests": entry("Flowbite.Tests.Utilities", "Utilities/DebouncerTests.cs",
+                            "var debouncer = new Debouncer();"),
+    "ElementClassTests": entry("Flowbite.Tests.Utilities", "Utilities/ElementClassTests.cs",
+                               "ElementClass.Empty()"),
+    "TailwindMergeTests": entry("Flowbite.Tests.Services", "Services/TailwindMergeTests.cs",
+                                "new TwMerge()"),
+    "CollapseStateTests": entry("Flowbite.Tests.Components", "Components/CollapseStateTests.cs",
+                                "RenderComponent<Sidebar>(); RenderComponent<Navbar>();"),
+}
+
+
+def affected(*paths):
+    return build.find_affected_tests([Path(p) for p in paths], INDEX)
+
+
+class FindAffectedTestsTests(unittest.TestCase):
+    def test_test_file_reruns_its_own_classes(self):
+        self.assertEqual(affected(TESTS / "Utilities/DebouncerTests.cs"),
+                         ["Flowbite.Tests.Utilities.DebouncerTests"])
+
+    def test_integration_files_rerun_nothing(self):
+        self.assertEqual(affected(TESTS / "Integration/DemoAppSmokeTests.cs"), [])
+        self.assertEqual(affected(TESTS / "Integration/PlaywrightFixture.cs"), [])
+
+    def test_shared_setup_and_project_files_rerun_everything(self):
+        for path in [TESTS / "TestSetup/FlowbiteTestContext.cs", TESTS / "GlobalUsings.cs",
+                     TESTS / "Flowbite.Tests.csproj", SRC / "_Imports.razor",
+                     SRC / "Base/IconBase.cs"]:
+            with self.subTest(path=str(path)):
+                self.assertIsNone(affected(path))
+
+    def test_source_maps_to_name_tests(self):
+        self.assertEqual(affected(SRC / "Utilities/ElementClass.cs"),
+                         ["Flowbite.Tests.Utilities.ElementClassTests"])
+
+    def test_source_maps_to_referencing_tests(self):
+        for path in [SRC / "Components/Sidebar/Sidebar.razor", SRC / "Components/Navbar/Navbar.razor.cs"]:
+            with self.subTest(path=str(path)):
+                self.assertEqual(affected(path), ["Flowbite.Tests.Components.CollapseStateTests"])
+
+    def test_unmapped_source_reruns_everything(self):
+        # Sharing a namespace with a test, or having none at all, is not coverage
+        for path in [SRC / "Services/ToastService.cs", SRC / "Common/SlotBase.cs",
+                     SRC / "Components/Tabs/Tab.razor", SRC / "Components/Alert.razor"]:
+            with self.subTest(path=str(path)):
+                self.assertIsNone(affected(path))
+
+    def test_any_unmapped_change_reruns_everything(self):
+        self.assertIsNone(affected(SRC / "Utilities/Debouncer.cs", SRC / "Common/SlotBase.cs"))
+
+    def test_mapped_changes_are_merged(self):
+        self.assertEqual(affected(SRC / "Utilities/Debouncer.cs", TESTS / "Services/TailwindMergeTests.cs"),
+                         ["Flowbite.Tests.Services.TailwindMergeTests",
+                          "Flowbite.Tests.Utilities.DebouncerTests"])
+
+
+class IndexTestClassesTests(unittest.TestCase):
+    def setUp(self):
+        # build.py paths are relative to the repository root
+        previous = os.getcwd()
+        os.chdir(ROOT)
+        self.addCleanup(os.chdir, previous)
+
+    def test_indexes_unit_tests_but_not_integration_tests(self):
+        index = build.index_test_classes()
+        self.assertEqual(index["DebouncerTests"]["namespace"], "Flowbite.Tests.Utilities")
+        self.assertNotIn("DemoAppSmokeTests", index)
+
+
+if __name__ == "__main__":
+    unittest.main()